@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+"""
+Gunicorn configuration for the JobGenie Flask apps.
+
+Run with:
+    gunicorn -c gunicorn_conf.py integrated_app:app
+    gunicorn -c gunicorn_conf.py converter_app:app
+"""
+
+import multiprocessing
+
+bind = '0.0.0.0:3001'
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = 'gthread'
+threads = 4
+
+# PDF conversions can take a while; don't let gunicorn kill them mid-render
+timeout = 120
+
+# Import (and prewarm) the app once in the master, then fork; workers share
+# the warmed font/stylesheet pages copy-on-write
+preload_app = True
+
+# Let the kernel move static download bytes when the worker supports it
+sendfile = True
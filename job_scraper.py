@@ -1,12 +1,132 @@
 #!/usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 
+# One pooled session for the whole run: keep-alive skips the TCP+TLS
+# handshake on repeat same-host requests, and transient errors are retried
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
+# Fetch this many URLs at once; each is I/O-bound on network latency
+MAX_WORKERS = 16
+
+# Serve pages from the on-disk cache for this long before revalidating
+DEFAULT_CACHE_TTL = 3600
+
+# Minimum spacing between requests to the same host, so unrelated hosts
+# never queue behind each other
+HOST_REQUEST_INTERVAL = 1.0
+_host_next_ok = {}
+_host_lock = Lock()
+
+# Serializes appends to the combined output file across worker threads
+_writer_lock = Lock()
+
+# Skip non-content subtrees at parse time so they are never built at all;
+# the name callable takes a single argument, which both bs4 <4.13 and the
+# 4.13+ match API invoke it with
+_CONTENT_STRAINER = SoupStrainer(
+    lambda name: name not in ('script', 'style', 'noscript', 'head', 'svg'))
+
+def _cache_path(url, output_dir):
+    """Return the cache file for a URL, sharded by hash prefix."""
+    digest = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(output_dir, '.cache', digest[:2], f"{digest}.bin")
+
+def _fetch_with_cache(url, output_dir, session, ttl):
+    """Fetch a page into the on-disk cache and return the cache file path.
+
+    A fresh copy is reused without touching the network; a stale one is
+    revalidated with If-None-Match/If-Modified-Since so an unchanged page
+    costs a 304 instead of a full body transfer. New bodies are streamed
+    straight to disk in chunks, so the page is never held in memory whole.
+    Returns None when the URL resolves to non-HTML content.
+    """
+    cache_file = _cache_path(url, output_dir)
+    meta_file = cache_file + '.meta.json'
+
+    conditional_headers = {}
+    if os.path.exists(cache_file):
+        if time.time() - os.path.getmtime(cache_file) < ttl:
+            # Fresh hit: no network at all
+            return cache_file
+        try:
+            with open(meta_file, 'r') as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                conditional_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = meta['last_modified']
+        except (FileNotFoundError, ValueError):
+            pass
+
+    _throttle_host(url)
+
+    # Cheap HEAD gate: skip PDFs, images, and other non-HTML targets
+    # before transferring their whole body. Many hosts reject HEAD
+    # (403/405), in which case we just fall through to the GET.
+    try:
+        head = session.head(url, allow_redirects=True, timeout=10)
+        if head.ok and 'html' not in head.headers.get('Content-Type', 'text/html'):
+            return None
+    except requests.exceptions.RequestException:
+        pass
+
+    with session.get(url, timeout=30, stream=True,
+                     headers=conditional_headers or None) as response:
+        if response.status_code == 304 and os.path.exists(cache_file):
+            # Unchanged upstream: refresh the TTL clock and reuse the cached body
+            os.utime(cache_file)
+            return cache_file
+
+        response.raise_for_status()  # Raise an exception for 4XX/5XX responses
+
+        # Stream the (decompressed) body sequentially into the cache file
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=1 << 16):
+                f.write(chunk)
+        with open(meta_file, 'w') as f:
+            json.dump({'etag': response.headers.get('ETag'),
+                       'last_modified': response.headers.get('Last-Modified')}, f)
+
+    return cache_file
+
+def _throttle_host(url):
+    """Sleep just enough to keep at most one request per second per host.
+
+    Each caller reserves the host's next send slot under the lock, then
+    sleeps outside it, so waiting threads queue fairly without re-checking.
+    """
+    host = urlparse(url).netloc
+    with _host_lock:
+        now = time.monotonic()
+        next_ok = _host_next_ok.get(host, now)
+        wait = next_ok - now
+        _host_next_ok[host] = max(next_ok, now) + HOST_REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
 def read_urls_from_file(file_path):
     """Read URLs from a text file, one URL per line."""
     try:
@@ -21,27 +141,36 @@ def read_urls_from_file(file_path):
         print(f"Error reading file: {e}")
         sys.exit(1)
 
-def download_content(url, output_dir="downloaded_jobs"):
-    """Download content from a URL and save it to a file."""
+def download_content(url, output_dir="downloaded_jobs", session=_SESSION,
+                     cache_ttl=DEFAULT_CACHE_TTL, combined_writer=None):
+    """Download content from a URL and save it to a file.
+
+    With combined_writer set, the result is appended to that shared JSONL
+    handle instead of creating one small file (and its metadata syncs)
+    per URL.
+    """
     try:
-        # Add a small delay to avoid overwhelming the server
-        time.sleep(1)
+        # Reuse the on-disk copy when fresh; revalidate when stale
+        cache_file = _fetch_with_cache(url, output_dir, session, cache_ttl)
+        if cache_file is None:
+            print(f"Skipping non-HTML content: {url}")
+            return False
         
-        # Make the request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()  # Raise an exception for 4XX/5XX responses
-        
-        # Extract text content using BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract text from the page (removing script and style elements)
-        for script in soup(["script", "style"]):
-            script.extract()
+        # Feed the parser from the cache file instead of an in-memory body;
+        # the strainer drops script/style/head subtrees during the parse
+        with open(cache_file, 'rb') as f:
+            soup = BeautifulSoup(f, 'lxml', parse_only=_CONTENT_STRAINER)
         text = soup.get_text(separator='\n', strip=True)
         
+        if combined_writer is not None:
+            # One line per page on the shared writer; a single buffered
+            # write per URL, no per-URL open/close
+            line = json.dumps({'url': url, 'text': text}).encode() + b'\n'
+            with _writer_lock:
+                combined_writer.write(line)
+            print(f"Successfully downloaded: {url}")
+            return True
+        
         # Create a filename based on the URL
         parsed_url = urlparse(url)
         domain = parsed_url.netloc
@@ -53,11 +182,12 @@ def download_content(url, output_dir="downloaded_jobs"):
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save the content to a file
+        # Build the body once and issue a single buffered write; no fsync,
+        # the OS writeback amortizes the flushes across files
         output_path = os.path.join(output_dir, filename)
-        with open(output_path, 'w', encoding='utf-8') as file:
-            file.write(f"Source URL: {url}\n\n")
-            file.write(text)
+        body = f"Source URL: {url}\n\n{text}"
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as file:
+            file.write(body)
         
         print(f"Successfully downloaded: {url} -> {output_path}")
         return True
@@ -69,12 +199,26 @@ def download_content(url, output_dir="downloaded_jobs"):
         return False
 
 def main():
+    args = sys.argv[1:]
+    
+    # Optional combined-output mode: all pages go to one JSONL file
+    combined_path = None
+    if '--combined-output' in args:
+        idx = args.index('--combined-output')
+        try:
+            combined_path = args[idx + 1]
+        except IndexError:
+            print("Error: --combined-output requires a file path.")
+            sys.exit(1)
+        del args[idx:idx + 2]
+    
     # Check if a file path was provided
-    if len(sys.argv) < 2:
-        print("Usage: python job_scraper.py <url_file_path>")
+    if not args:
+        print("Usage: python job_scraper.py <url_file_path> [cache_ttl_seconds] [--combined-output combined.jsonl]")
         sys.exit(1)
     
-    url_file = sys.argv[1]
+    url_file = args[0]
+    cache_ttl = int(args[1]) if len(args) > 1 else DEFAULT_CACHE_TTL
     urls = read_urls_from_file(url_file)
     
     print(f"Found {len(urls)} URLs in {url_file}")
@@ -82,24 +226,32 @@ def main():
     # Create a directory for downloaded content
     output_dir = "downloaded_jobs"
     
-    # Track success and failure counts
-    success_count = 0
-    failure_count = 0
+    # Fetch URLs concurrently; downloads are network-bound, so the run is
+    # dominated by the slowest host instead of the sum of all latencies
+    combined_writer = open(combined_path, 'wb', buffering=1 << 20) if combined_path else None
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            results = list(pool.map(
+                lambda url: download_content(url, output_dir, session=_SESSION,
+                                             cache_ttl=cache_ttl,
+                                             combined_writer=combined_writer),
+                urls))
+    finally:
+        if combined_writer is not None:
+            combined_writer.close()
     
-    # Process each URL
-    for i, url in enumerate(urls, 1):
-        print(f"Processing {i}/{len(urls)}: {url}")
-        if download_content(url, output_dir):
-            success_count += 1
-        else:
-            failure_count += 1
+    success_count = sum(1 for ok in results if ok)
+    failure_count = len(results) - success_count
     
     # Print summary
     print("\nDownload Summary:")
     print(f"Total URLs: {len(urls)}")
     print(f"Successfully downloaded: {success_count}")
     print(f"Failed: {failure_count}")
-    print(f"Downloaded content saved to: {os.path.abspath(output_dir)}")
+    if combined_path:
+        print(f"Downloaded content saved to: {os.path.abspath(combined_path)}")
+    else:
+        print(f"Downloaded content saved to: {os.path.abspath(output_dir)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,20 +3,20 @@
 import os
 import sys
 import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import markdown
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, HRFlowable, Table, TableStyle
+from markdown import treeprocessors
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, mm
+from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, blue
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.graphics.shapes import Drawing, Line
-from reportlab.graphics import renderPDF
-from html.parser import HTMLParser
-import re
 import unicodedata
 
 # Emoji mappings disabled
@@ -36,25 +36,40 @@ import unicodedata
 #     ':square:': '■'
 # }
 
+# Emoji code point ranges removed from PDF text (they render as boxes)
+_EMOJI_RANGES = [
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F680, 0x1F6FF),  # transport & map symbols
+    (0x1F1E0, 0x1F1FF),  # flags (iOS)
+    (0x2702, 0x27B0),    # dingbats
+    (0x24C2, 0x1F251),
+    (0x1F900, 0x1F9FF),  # supplemental symbols
+    (0x1FA70, 0x1FAFF),  # symbols and pictographs extended-a
+]
+
+# Deletion table built once; str.translate runs in C with no regex engine
+_EMOJI_TRANS = dict.fromkeys(
+    cp for lo, hi in _EMOJI_RANGES for cp in range(lo, hi + 1))
+
+# XML-escape table for ReportLab paragraph markup, applied in the same pass
+_XML_ESCAPE_TRANS = {ord('&'): '&amp;', ord('<'): '&lt;', ord('>'): '&gt;'}
+
 def remove_emojis(text):
     """Remove emoji characters from text to prevent square boxes in PDF"""
-    # Remove emoji characters using Unicode categories
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA70-\U0001FAFF"  # symbols and pictographs extended-a
-        "]+", flags=re.UNICODE)
-    return emoji_pattern.sub('', text)
+    return text.translate(_EMOJI_TRANS)
+
+# Font registration is global in ReportLab; remember that it happened so
+# re-entry stays a no-op even if the lru caches are cleared
+_FONT_REGISTERED = False
 
 # ReportLab styles for professional resume
+@lru_cache(maxsize=1)
 def setup_unicode_fonts():
     """Setup Unicode fonts for better character support"""
+    global _FONT_REGISTERED
+    if _FONT_REGISTERED:
+        return True
     try:
         # Try to register system fonts that support more Unicode characters
         import platform
@@ -81,6 +96,7 @@ def setup_unicode_fonts():
             if os.path.exists(font_path):
                 try:
                     pdfmetrics.registerFont(TTFont('UnicodeFont', font_path))
+                    _FONT_REGISTERED = True
                     return True
                 except Exception as e:
                     print(f"Could not register font {font_path}: {e}")
@@ -90,8 +106,13 @@ def setup_unicode_fonts():
         print(f"Warning: Could not setup Unicode fonts: {e}")
         return False
 
+@lru_cache(maxsize=1)
 def get_resume_styles():
-    """Create custom styles for the resume."""
+    """Create custom styles for the resume.
+
+    Cached: the styles are deterministic and never mutated per call, so
+    batch conversions skip the font probing and stylesheet rebuild.
+    """
     styles = getSampleStyleSheet()
     
     # Setup Unicode font support
@@ -186,126 +207,167 @@ def get_resume_styles():
     
     return styles
 
-class HTMLToReportLabParser(HTMLParser):
-    """Parse HTML and convert to ReportLab elements."""
-    
-    def __init__(self, styles):
-        super().__init__()
-        self.styles = styles
+_HEADER_STYLE_BY_TAG = {
+    'h1': 'ResumeTitle',
+    'h2': 'SectionHeader',
+    'h3': 'SubHeader',
+    'h4': 'SubHeader',
+    'h5': 'SubHeader',
+    'h6': 'SubHeader',
+}
+
+# Inline tags that map onto ReportLab paragraph markup
+_INLINE_MARKUP = {'strong': ('<b>', '</b>'), 'em': ('<i>', '</i>')}
+
+def _clean_text(text):
+    """Strip emojis, normalize, and XML-escape a text fragment."""
+    text = remove_emojis(text)
+    # Pure-ASCII text (the common case) is already NFC
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    return text.translate(_XML_ESCAPE_TRANS)
+
+def _flatten_inline(elem):
+    """Flatten an element's inline content into paragraph markup."""
+    parts = []
+    if elem.text:
+        parts.append(_clean_text(elem.text))
+    for child in elem:
+        open_tag, close_tag = _INLINE_MARKUP.get(child.tag, ('', ''))
+        parts.append(open_tag + _flatten_inline(child) + close_tag)
+        if child.tail:
+            parts.append(_clean_text(child.tail))
+    return ''.join(parts)
+
+class ReportLabTreeprocessor(treeprocessors.Treeprocessor):
+    """Emit ReportLab flowables straight from markdown's element tree.
+
+    Walking the tree during conversion skips the serialize-to-HTML plus
+    re-parse round trip the old HTMLParser-based converter paid for every
+    document. The finished story is left on self.story.
+    """
+
+    def __init__(self, md):
+        super().__init__(md)
         self.story = []
-        self.current_text = ""
-        self.current_style = 'ResumeBodyText'
-        self.in_header = False
-        self.header_level = 1
-        self.in_paragraph = False
-        self.in_list = False
-        self.list_items = []
-        
-    def handle_starttag(self, tag, attrs):
-        if tag == 'h1':
-            self.in_header = True
-            self.header_level = 1
-            self.current_style = 'ResumeTitle'
-        elif tag in ['h2', 'h3', 'h4', 'h5', 'h6']:
-            self.in_header = True
-            self.header_level = int(tag[1])
-            if self.header_level == 2:
-                self.current_style = 'SectionHeader'
+
+    def run(self, root):
+        self.story = []
+        self.styles = get_resume_styles()
+        self._walk(root)
+        return root
+
+    def _walk(self, parent):
+        styles = self.styles
+        for elem in parent:
+            tag = elem.tag
+            if tag in _HEADER_STYLE_BY_TAG:
+                text = _flatten_inline(elem).strip()
+                if text:
+                    self.story.append(Paragraph(text, styles[_HEADER_STYLE_BY_TAG[tag]]))
+            elif tag in ('p', 'pre'):
+                text = _flatten_inline(elem).strip()
+                if text:
+                    self.story.append(Paragraph(text, styles['ResumeBodyText']))
+            elif tag in ('ul', 'ol'):
+                # One Paragraph for the whole list: N bullet items cost one
+                # markup parse and one wrap computation instead of N
+                items = (_flatten_inline(li).strip() for li in elem)
+                text = '<br/>'.join(f"• {item}" for item in items if item)
+                if text:
+                    self.story.append(Paragraph(text, styles['BulletPoint']))
+            elif tag == 'hr':
+                self.story.append(Spacer(1, 8))
+                self.story.append(HRFlowable(width="100%", thickness=1.5, lineCap='round', color=HexColor('#34495e'), spaceBefore=4, spaceAfter=4))
+                self.story.append(Spacer(1, 8))
             else:
-                self.current_style = 'SubHeader'
-        elif tag == 'p':
-            self.in_paragraph = True
-            self.current_style = 'ResumeBodyText'
-        elif tag in ['ul', 'ol']:
-            self.in_list = True
-            self.list_items = []
-        elif tag == 'li':
-            self.current_style = 'BulletPoint'
-        elif tag == 'strong':
-            self.current_text += '<b>'
-        elif tag == 'em':
-            self.current_text += '<i>'
-        elif tag == 'hr':
-            # Handle horizontal rule
-            if self.current_text.strip():
-                self.story.append(Paragraph(self.current_text, self.styles[self.current_style]))
-                self.current_text = ''
-            # Add horizontal line with full width styling
-            self.story.append(Spacer(1, 8))
-            self.story.append(HRFlowable(width="100%", thickness=1.5, lineCap='round', color=HexColor('#34495e'), spaceBefore=4, spaceAfter=4))
-            self.story.append(Spacer(1, 8))
-            
-    def handle_endtag(self, tag):
-        if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            if self.current_text.strip():
-                self.story.append(Paragraph(self.current_text.strip(), self.styles[self.current_style]))
-                self.current_text = ""
-            self.in_header = False
-        elif tag == 'p':
-            if self.current_text.strip():
-                self.story.append(Paragraph(self.current_text.strip(), self.styles[self.current_style]))
-                self.current_text = ""
-            self.in_paragraph = False
-        elif tag in ['ul', 'ol']:
-            for item in self.list_items:
-                self.story.append(Paragraph(f"• {item}", self.styles['BulletPoint']))
-            self.list_items = []
-            self.in_list = False
-        elif tag == 'li':
-            if self.current_text.strip():
-                self.list_items.append(self.current_text.strip())
-                self.current_text = ""
-        elif tag == 'strong':
-            self.current_text += '</b>'
-        elif tag == 'em':
-            self.current_text += '</i>'
-            
-    def handle_data(self, data):
-        # Clean and add text data with Unicode normalization
-        if data.strip():
-            # Remove emoji characters to prevent square boxes
-            clean_data = remove_emojis(data)
-            
-            # Normalize Unicode characters for better display
-            normalized_data = unicodedata.normalize('NFC', clean_data)
-            
-            # Emoji shortcode replacement disabled
-            # for shortcode, emoji in EMOJI_MAP.items():
-            #     normalized_data = normalized_data.replace(shortcode, emoji)
-            
-            # Escape XML characters for ReportLab
-            normalized_data = normalized_data.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            self.current_text += normalized_data
-        else:
-            self.current_text += data
-        
-    def get_story(self):
-        # Add any remaining text
-        if self.current_text.strip():
-            self.story.append(Paragraph(self.current_text.strip(), self.styles[self.current_style]))
-        return self.story
-
-def html_to_reportlab(html_content):
-    """Convert HTML content to ReportLab story elements."""
-    styles = get_resume_styles()
-    parser = HTMLToReportLabParser(styles)
-    
-    # Clean up HTML content
-    html_content = re.sub(r'<[^>]+>', lambda m: m.group(0).lower(), html_content)
-    html_content = html_content.replace('\n', ' ').replace('\r', '')
-    html_content = re.sub(r'\s+', ' ', html_content)
-    
-    parser.feed(html_content)
-    return parser.get_story()
+                # Container elements (blockquote, toc div wrappers, ...)
+                self._walk(elem)
+
+# One shared converter: constructing markdown.Markdown loads extensions
+# (codehilite pulls in Pygments) and is far costlier than reset(). The
+# instance carries per-document state, so conversions serialize on the
+# lock; the webapp runs jobs on a thread pool
+_MD = None
+_MD_LOCK = threading.Lock()
+
+def _get_md():
+    """Return the shared Markdown converter, building it on first use."""
+    global _MD
+    if _MD is None:
+        _MD = markdown.Markdown(extensions=[
+            'markdown.extensions.extra',
+            'markdown.extensions.codehilite',
+            'markdown.extensions.toc'
+        ])
+        _MD.treeprocessors.register(ReportLabTreeprocessor(_MD), 'reportlab', 5)
+    return _MD
+
+def prewarm():
+    """Register fonts and build the stylesheet ahead of the first conversion.
+
+    Font registration is global in ReportLab, so doing it at server import
+    time keeps that cost out of the first request.
+    """
+    get_resume_styles()
+
+def build_pdf_from_markdown(markdown_content, output_file):
+    """Render a markdown string to a PDF file.
+
+    Args:
+        markdown_content (str): Markdown source text
+        output_file (str or Path): Path to the output PDF file
+
+    Returns:
+        str: Path to the generated PDF file
+    """
+    # Convert on the shared converter; reset() clears per-document state
+    # without rebuilding the extensions, and the registered treeprocessor
+    # collects the ReportLab story during the tree walk. The lock covers
+    # reset/convert and the story grab: run() rebinds the treeprocessor's
+    # story list, so the reference taken here stays ours after release
+    with _MD_LOCK:
+        md = _get_md()
+        md.reset()
+        md.convert(markdown_content)
+        story = md.treeprocessors['reportlab'].story
+
+    # Create PDF using ReportLab
+    doc = SimpleDocTemplate(
+        str(output_file),
+        pagesize=A4,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+
+    doc.build(story)
+
+    print(f"✅ PDF generated successfully: {output_file}")
+    return str(output_file)
+
+def convert_markdown_bytes_to_pdf(markdown_bytes, output_file):
+    """
+    Convert in-memory Markdown bytes to PDF without an input-file roundtrip.
+
+    Args:
+        markdown_bytes (bytes): UTF-8 encoded Markdown content
+        output_file (str): Path to the output PDF file
+
+    Returns:
+        str: Path to the generated PDF file
+    """
+    return build_pdf_from_markdown(markdown_bytes.decode('utf-8'), output_file)
 
 def convert_markdown_to_pdf(input_file, output_file=None):
     """
     Convert a Markdown file to PDF with professional styling.
-    
+
     Args:
         input_file (str): Path to the input Markdown file
         output_file (str, optional): Path to the output PDF file
-    
+
     Returns:
         str: Path to the generated PDF file
     """
@@ -314,60 +376,22 @@ def convert_markdown_to_pdf(input_file, output_file=None):
         input_path = Path(input_file)
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
-        
+
         if not input_path.suffix.lower() in ['.md', '.markdown']:
             raise ValueError("Input file must be a Markdown file (.md or .markdown)")
-        
+
         # Set output file path
         if output_file is None:
             output_file = input_path.with_suffix('.pdf')
         else:
             output_file = Path(output_file)
-        
+
         # Read the markdown file
         with open(input_path, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
-        
-        # Convert markdown to HTML
-        md = markdown.Markdown(extensions=[
-            'markdown.extensions.extra',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc'
-        ])
-        html_content = md.convert(markdown_content)
-        
-        # Create complete HTML document with styling
-        full_html = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Resume</title>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
-        
-        # Create PDF using ReportLab
-        doc = SimpleDocTemplate(
-            str(output_file),
-            pagesize=A4,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
-        
-        # Convert HTML to ReportLab elements
-        story = html_to_reportlab(html_content)
-        doc.build(story)
-        
-        print(f"✅ PDF generated successfully: {output_file}")
-        return str(output_file)
-        
+
+        return build_pdf_from_markdown(markdown_content, output_file)
+
     except Exception as e:
         print(f"❌ Error converting markdown to PDF: {str(e)}")
         sys.exit(1)
@@ -384,18 +408,27 @@ Examples:
   python md_to_pdf.py resume.md
   python md_to_pdf.py resume.md -o my_resume.pdf
   python md_to_pdf.py resume.md --output /path/to/output.pdf
+  python md_to_pdf.py resume1.md resume2.md resume3.md --jobs 4
         """
     )
     
     parser.add_argument(
-        'input_file',
-        help='Input Markdown file (.md or .markdown)'
+        'input_files',
+        nargs='+',
+        help='Input Markdown file(s) (.md or .markdown)'
     )
     
     parser.add_argument(
         '-o', '--output',
         dest='output_file',
-        help='Output PDF file path (default: same name as input with .pdf extension)'
+        help='Output PDF file path (single input only; default: same name as input with .pdf extension)'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for batch conversion (default: CPU count)'
     )
     
     parser.add_argument(
@@ -406,8 +439,21 @@ Examples:
     
     args = parser.parse_args()
     
-    print(f"🔄 Converting {args.input_file} to PDF...")
-    convert_markdown_to_pdf(args.input_file, args.output_file)
+    if len(args.input_files) == 1:
+        print(f"🔄 Converting {args.input_files[0]} to PDF...")
+        convert_markdown_to_pdf(args.input_files[0], args.output_file)
+        return
+    
+    if args.output_file:
+        print("❌ --output only applies to a single input file")
+        sys.exit(1)
+    
+    # Each build is CPU-bound in ReportLab serialization and independent,
+    # so a process per file scales near-linearly; the cached converter and
+    # stylesheet initialize once per worker process
+    print(f"🔄 Converting {len(args.input_files)} files to PDF...")
+    with ProcessPoolExecutor(max_workers=args.jobs or os.cpu_count()) as pool:
+        list(pool.map(convert_markdown_to_pdf, args.input_files))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
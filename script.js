@@ -251,7 +251,7 @@ document.addEventListener('DOMContentLoaded', () => {
         const originalText = resultContent.innerHTML;
         resultContent.innerHTML = '<p class="placeholder-text">Generating PDF... Please wait.</p>';
         
-        // Send to server for conversion
+        // Send to server for conversion, then poll the background job
         fetch('/convert-resume', {
             method: 'POST',
             headers: {
@@ -262,28 +262,50 @@ document.addEventListener('DOMContentLoaded', () => {
         .then(response => response.json())
         .then(data => {
             if (data.success) {
+                return pollConversion(data.job_id);
+            }
+            throw new Error(data.error);
+        })
+        .then(job => {
+            if (job.state === 'SUCCESS') {
                 // Automatically trigger download
-                const downloadUrl = `/download/${data.filename}`;
+                const downloadUrl = `/download/${job.filename}`;
                 const link = document.createElement('a');
                 link.href = downloadUrl;
-                link.download = data.filename;
+                link.download = job.filename;
                 document.body.appendChild(link);
                 link.click();
                 document.body.removeChild(link);
-                
+
                 // Restore original content
                 resultContent.innerHTML = originalText;
             } else {
-                alert(`Error: ${data.error}`);
+                alert(`Error: ${job.error}`);
                 resultContent.innerHTML = originalText;
             }
         })
         .catch(error => {
-            alert(`Network error: ${error.message}`);
+            alert(`Error: ${error.message}`);
             resultContent.innerHTML = originalText;
         });
     }
 
+    /**
+     * Poll a background conversion job until it finishes
+     */
+    async function pollConversion(jobId) {
+        while (true) {
+            const response = await fetch(`/status/${jobId}`);
+            const job = await response.json();
+
+            if (job.state !== 'PENDING') {
+                return job;
+            }
+
+            await new Promise(resolve => setTimeout(resolve, 500));
+        }
+    }
+
     /**
      * Download tailored resume as Markdown file
      */
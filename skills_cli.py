@@ -11,7 +11,7 @@ identifying missing skills, and suggesting relevant online certifications.
 import os
 import sys
 import argparse
-from utils.resume_parser import ResumeParser
+from utils._resume_cache import get_or_parse
 from utils.skills_analyzer import SkillsAnalyzer
 
 
@@ -61,10 +61,9 @@ def main():
         job_description = args.job_text
     
     try:
-        # Parse resume
+        # Parse resume (cached by content hash across invocations)
         print("Parsing resume...")
-        resume_parser = ResumeParser()
-        resume_data = resume_parser.parse(args.resume_path)
+        resume_data = get_or_parse(args.resume_path)
         
         # Extract skills from resume
         resume_skills = resume_data.get('skills', [])
@@ -8,6 +8,7 @@ This module provides the main window UI for the Job Genie application.
 
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox, ttk
 from utils.resume_parser import ResumeParser
 from utils.skills_analyzer import SkillsAnalyzer
@@ -31,6 +32,22 @@ class MainWindow:
         self.resume_data = None
         self.job_analysis = None
         
+        # Heavy work (PDF parsing, future scraping) runs here so the Tk
+        # main loop keeps repainting; results come back via root.after
+        self._pool = ThreadPoolExecutor(max_workers=4)
+        self._generate_future = None
+        self._analyze_future = None
+        
+        # Parsed resumes keyed by (path, mtime): repeat Generate clicks on
+        # an unchanged file skip the whole parse
+        self._resume_cache = {}
+        
+        # True while the corresponding results widget holds content, so
+        # clear_all can skip the NORMAL/delete/DISABLED dance on widgets
+        # that are already empty
+        self._skills_dirty = False
+        self._cert_dirty = False
+        
         # Create main frame
         self.main_frame = ttk.Frame(self.root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -110,6 +127,18 @@ class MainWindow:
         
         self.job_text = tk.Text(job_text_frame, height=10, width=50)
         self.job_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        # Mirror the widget contents into a Python string on edit, so the
+        # button handlers read it without copying the whole buffer out of
+        # Tcl on every click
+        self._job_text_cache = ""
+        self.job_text.bind("<<Modified>>", self._on_job_text_modified)
+
+    def _on_job_text_modified(self, event=None):
+        """Refresh the cached job description when the Text widget changes."""
+        self._job_text_cache = self.job_text.get("1.0", tk.END)
+        # Reset the flag or Tk stops firing <<Modified>> for later edits
+        self.job_text.edit_modified(False)
     
     def create_skills_analysis_section(self):
         """Create the skills analysis section."""
@@ -149,13 +178,22 @@ class MainWindow:
         button_frame = ttk.Frame(self.input_tab)
         button_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Generate button
-        generate_button = ttk.Button(button_frame, text="Generate Tailored Resume", command=self.generate_resume)
-        generate_button.pack(side=tk.LEFT, padx=(0, 10))
+        # Generate button; disabled while a parse is in flight so a second
+        # click cannot race two parses on the shared ResumeParser
+        self.generate_button = ttk.Button(button_frame, text="Generate Tailored Resume", command=self.generate_resume)
+        self.generate_button.pack(side=tk.LEFT, padx=(0, 10))
         
         # Clear button
         clear_button = ttk.Button(button_frame, text="Clear All", command=self.clear_all)
         clear_button.pack(side=tk.LEFT)
+        
+        # Cancel button for an in-flight generation
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_generate, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Busy indicator shown while background work runs
+        self.progress = ttk.Progressbar(button_frame, mode='indeterminate', length=160)
+        self.progress.pack(side=tk.LEFT, padx=(10, 0))
     
     def browse_resume(self):
         """Open file dialog to select master resume."""
@@ -178,25 +216,65 @@ class MainWindow:
         
         # Get job description
         job_url = self.job_url_var.get().strip()
-        job_text = self.job_text.get("1.0", tk.END).strip()
+        job_text = self._job_text_cache.strip()
         
         if not job_url and not job_text:
             messagebox.showerror("Error", "Please provide a job URL or paste a job description.")
             return
         
+        # Reuse the cached parse when the file hasn't changed since last time
         try:
-            # Parse the resume
-            self.resume_data = self.resume_parser.parse(resume_path)
-            
-            # Show a message that this is a demo
-            messagebox.showinfo("Demo", "This is a demo version. In a full implementation, this would generate a tailored resume based on your inputs.")
-            
-            # Switch to the skills analysis tab
-            self.notebook.select(1)  # Select the second tab (index 1)
-            
+            cache_key = (resume_path, os.path.getmtime(resume_path))
+        except OSError:
+            messagebox.showerror("Error", f"Could not read resume file: {resume_path}")
+            return
+        
+        cached = self._resume_cache.get(cache_key)
+        if cached is not None:
+            self.resume_data = cached
+            self._show_generate_result()
+            return
+        
+        # Parse the resume off the main thread so the UI keeps repainting;
+        # the done-callback marshals the result back via root.after
+        self.progress.start()
+        self.generate_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        future = self._pool.submit(self.resume_parser.parse, resume_path)
+        self._generate_future = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_generate_done, f, cache_key))
+    
+    def _on_generate_done(self, future, cache_key):
+        """Handle a finished (or cancelled) resume generation, on the Tk thread."""
+        self.progress.stop()
+        self.generate_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        self._generate_future = None
+        
+        if future.cancelled():
+            return
+        
+        try:
+            self.resume_data = future.result()
+            self._resume_cache[cache_key] = self.resume_data
+            self._show_generate_result()
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while parsing the resume: {str(e)}")
     
+    def _show_generate_result(self):
+        """Show the post-generation message and switch to the analysis tab."""
+        # Show a message that this is a demo
+        messagebox.showinfo("Demo", "This is a demo version. In a full implementation, this would generate a tailored resume based on your inputs.")
+        
+        # Switch to the skills analysis tab
+        self.notebook.select(1)  # Select the second tab (index 1)
+    
+    def cancel_generate(self):
+        """Cancel the pending generation if it has not started yet."""
+        if self._generate_future is not None:
+            self._generate_future.cancel()
+    
     def analyze_skills(self):
         """Analyze skills based on resume and job description."""
         # Check if resume has been parsed
@@ -205,7 +283,7 @@ class MainWindow:
             return
         
         # Get job description
-        job_text = self.job_text.get("1.0", tk.END).strip()
+        job_text = self._job_text_cache.strip()
         if not job_text:
             job_url = self.job_url_var.get().strip()
             if not job_url:
@@ -215,12 +293,26 @@ class MainWindow:
             messagebox.showinfo("Demo", "In a full implementation, this would fetch the job description from the URL.")
             return
         
+        # Get skills from resume
+        resume_skills = self.resume_data.get('skills', [])
+        
+        # Analyze off the main thread, same pattern as generate_resume
+        self.progress.start()
+        future = self._pool.submit(self.skills_analyzer.analyze, resume_skills, job_text)
+        self._analyze_future = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_analyze_done, f))
+    
+    def _on_analyze_done(self, future):
+        """Handle a finished skills analysis, on the Tk thread."""
+        self.progress.stop()
+        self._analyze_future = None
+        
+        if future.cancelled():
+            return
+        
         try:
-            # Get skills from resume
-            resume_skills = self.resume_data.get('skills', [])
-            
-            # Analyze skills
-            self.job_analysis = self.skills_analyzer.analyze(resume_skills, job_text)
+            self.job_analysis = future.result()
             
             # Display missing skills
             self.display_missing_skills(self.job_analysis['missing_skills'])
@@ -239,10 +331,12 @@ class MainWindow:
         if not missing_skills:
             self.missing_skills_text.insert(tk.END, "No missing skills identified. Your resume already covers all the skills mentioned in the job description!")
         else:
-            for skill in missing_skills:
-                self.missing_skills_text.insert(tk.END, f"• {skill}\n")
+            # One insert, one Tcl round-trip, one relayout for the whole list
+            self.missing_skills_text.insert(
+                tk.END, "\n".join(f"• {skill}" for skill in missing_skills))
         
         self.missing_skills_text.config(state=tk.DISABLED)
+        self._skills_dirty = True
     
     def display_certification_recommendations(self, cert_suggestions):
         """Display certification recommendations in the UI."""
@@ -252,12 +346,16 @@ class MainWindow:
         if not cert_suggestions:
             self.cert_text.insert(tk.END, "No specific certification recommendations for the identified missing skills.")
         else:
+            # Build the whole report in Python, then cross into Tcl once
+            parts = []
             for skill, certifications in cert_suggestions.items():
-                self.cert_text.insert(tk.END, f"For {skill}:\n")
+                parts.append(f"For {skill}:\n")
                 for cert in certifications:
-                    self.cert_text.insert(tk.END, f"• {cert['name']}\n  Provider: {cert['provider']}\n  URL: {cert['url']}\n\n")
+                    parts.append(f"• {cert['name']}\n  Provider: {cert['provider']}\n  URL: {cert['url']}\n\n")
+            self.cert_text.insert(tk.END, "".join(parts))
         
         self.cert_text.config(state=tk.DISABLED)
+        self._cert_dirty = True
     
     def clear_all(self):
         """Clear all input fields."""
@@ -268,15 +366,21 @@ class MainWindow:
         # Clear analysis results
         self.resume_data = None
         self.job_analysis = None
-        
-        # Clear skills analysis text fields
-        self.missing_skills_text.config(state=tk.NORMAL)
-        self.missing_skills_text.delete("1.0", tk.END)
-        self.missing_skills_text.config(state=tk.DISABLED)
-        
-        self.cert_text.config(state=tk.NORMAL)
-        self.cert_text.delete("1.0", tk.END)
-        self.cert_text.config(state=tk.DISABLED)
+        self._resume_cache.clear()
+        
+        # Clear skills analysis text fields, skipping widgets that are
+        # already empty (three Tcl round-trips each)
+        if self._skills_dirty:
+            self.missing_skills_text.config(state=tk.NORMAL)
+            self.missing_skills_text.delete("1.0", tk.END)
+            self.missing_skills_text.config(state=tk.DISABLED)
+            self._skills_dirty = False
+        
+        if self._cert_dirty:
+            self.cert_text.config(state=tk.NORMAL)
+            self.cert_text.delete("1.0", tk.END)
+            self.cert_text.config(state=tk.DISABLED)
+            self._cert_dirty = False
         
         # Switch back to the first tab
         self.notebook.select(0)
\ No newline at end of file
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resume Parse Cache
+
+Memoizes ResumeParser results on disk, keyed by the file's content hash,
+so re-analyzing the same resume against many job descriptions only pays
+for PDF/DOCX text extraction once.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from .resume_parser import ResumeParser
+
+# Bump whenever the parser's extraction logic changes, so stale cached
+# results are not reused
+PARSER_VERSION = 2
+
+CACHE_DIR = Path.home() / '.cache' / 'job-genie' / 'resumes'
+
+
+def _cache_file(file_bytes):
+    """Return the cache file for this resume content and parser version."""
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    return CACHE_DIR / f"{digest}-v{PARSER_VERSION}.json"
+
+
+def get_or_parse(path):
+    """Parse a resume, reusing the cached result for identical content.
+
+    Args:
+        path (str): Path to the resume file (PDF, DOCX, or MD)
+
+    Returns:
+        dict: Structured resume information
+    """
+    # In-process fast path first: a repeat parse of an unchanged file is
+    # one stat plus a dict lookup, no file read or hash. Deep-copied so
+    # callers can mutate their result without poisoning the cache.
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_cached(os.fspath(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=64)
+def _parse_cached(path, mtime_ns, size):
+    """Memoized disk-cache lookup; mtime_ns and size only key the entry."""
+    file_bytes = Path(path).read_bytes()
+    cache_file = _cache_file(file_bytes)
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (ValueError, OSError):
+            pass  # Corrupt or unreadable cache entry; reparse below
+
+    parsed_data = ResumeParser().parse(path)
+
+    # Write atomically (tempfile + rename) so a crash never leaves a
+    # half-written cache entry behind
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(parsed_data, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+    return parsed_data
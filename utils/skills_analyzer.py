@@ -9,28 +9,61 @@ compares them with the user's resume skills, and suggests missing skills
 along with relevant online certifications.
 """
 
+import json
+import os
 import re
-import nltk
-import spacy
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+from functools import lru_cache
 
-# Ensure NLTK data is downloaded
+# Optional: with pyahocorasick installed, skill matching is one DFA scan
+# in O(text length) regardless of how many skills are known
 try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Mapping of skills to recommended certifications, kept as data next to
+# this module so the interpreter does not build the whole nested literal
+# (hundreds of small objects) on import
+_CERTIFICATIONS_FILE = os.path.join(os.path.dirname(__file__), 'certifications.json')
+
+
+@lru_cache(maxsize=1)
+def _certification_index():
+    """Load the certification catalog once, keyed by lowercase skill."""
+    with open(_CERTIFICATIONS_FILE, 'r', encoding='utf-8') as f:
+        catalog = json.load(f)
+    return {skill.lower(): certs for skill, certs in catalog.items()}
+
+
+def _contained_sub_skills(skill_lookup):
+    """Map each skill phrase to the shorter known skills nested inside it.
+
+    The union regex is leftmost-longest, so a match on 'ruby on rails'
+    consumes the text that would also match 'Ruby', while the automaton
+    reports every overlapping occurrence. Crediting the nested skills
+    after each union-regex match keeps the two paths in agreement.
+    """
+    contained = {}
+    for lowered, skill in skill_lookup.items():
+        nested = tuple(
+            sub_skill for sub_lowered, sub_skill in skill_lookup.items()
+            if sub_lowered != lowered
+            and re.search(r'(?<!\w)' + re.escape(sub_lowered) + r'(?!\w)', lowered))
+        if nested:
+            contained[lowered] = nested
+    return contained
 
-# Load spaCy model
-try:
-    nlp = spacy.load('en_core_web_sm')
-except OSError:
-    import os
-    print("Downloading spaCy model...")
-    os.system('python -m spacy download en_core_web_sm')
-    nlp = spacy.load('en_core_web_sm')
+
+def _build_skill_automaton(skill_lookup):
+    """Build the Aho-Corasick skill automaton, or None without the library."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for lowered, skill in skill_lookup.items():
+        automaton.add_word(lowered, (len(lowered), skill))
+    automaton.make_automaton()
+    return automaton
 
 
 class SkillsAnalyzer:
@@ -67,108 +100,33 @@ class SkillsAnalyzer:
         ]
     }
     
-    # Mapping of skills to recommended certifications
-    CERTIFICATION_RECOMMENDATIONS = {
-        # Programming Languages
-        'Python': [
-            {'name': 'Python Institute PCEP', 'provider': 'Python Institute', 'url': 'https://pythoninstitute.org/certification/pcep-certification-entry-level/'},
-            {'name': 'Python Institute PCAP', 'provider': 'Python Institute', 'url': 'https://pythoninstitute.org/certification/pcap-certification-associate/'},
-            {'name': 'Microsoft Certified: Azure Developer Associate', 'provider': 'Microsoft', 'url': 'https://learn.microsoft.com/en-us/certifications/azure-developer/'}
-        ],
-        'Java': [
-            {'name': 'Oracle Certified Associate Java Programmer', 'provider': 'Oracle', 'url': 'https://education.oracle.com/oracle-certified-associate-java-se-8-programmer/trackp_333'},
-            {'name': 'Oracle Certified Professional Java Programmer', 'provider': 'Oracle', 'url': 'https://education.oracle.com/oracle-certified-professional-java-se-8-programmer/trackp_357'}
-        ],
-        'JavaScript': [
-            {'name': 'JavaScript Institute Certification', 'provider': 'W3Schools', 'url': 'https://www.w3schools.com/cert/cert_javascript.asp'},
-            {'name': 'Certified JavaScript Developer', 'provider': 'DevSkiller', 'url': 'https://devskiller.com/certifications/'}
-        ],
-        
-        # Frameworks & Libraries
-        'React': [
-            {'name': 'Meta React Developer Professional Certificate', 'provider': 'Coursera', 'url': 'https://www.coursera.org/professional-certificates/meta-front-end-developer'},
-            {'name': 'React.js Certification', 'provider': 'W3Schools', 'url': 'https://www.w3schools.com/cert/cert_react.asp'}
-        ],
-        'Angular': [
-            {'name': 'Angular Certification', 'provider': 'Angular.io', 'url': 'https://angular.io/guide/certification'},
-            {'name': 'Angular Developer Certification', 'provider': 'Udemy', 'url': 'https://www.udemy.com/course/angular-certification/'}
-        ],
-        'Django': [
-            {'name': 'Django Developer Certification', 'provider': 'Udemy', 'url': 'https://www.udemy.com/course/django-python-advanced/'},
-            {'name': 'Python Django Full Stack Developer Bootcamp', 'provider': 'Udemy', 'url': 'https://www.udemy.com/course/python-and-django-full-stack-web-developer-bootcamp/'}
-        ],
-        
-        # Databases
-        'MySQL': [
-            {'name': 'Oracle MySQL Database Administration', 'provider': 'Oracle', 'url': 'https://education.oracle.com/mysql-database-administration/pexam_1Z0-888'},
-            {'name': 'MySQL Developer Certification', 'provider': 'Oracle', 'url': 'https://education.oracle.com/mysql-5-developer/pexam_1Z0-882'}
-        ],
-        'MongoDB': [
-            {'name': 'MongoDB Certified Developer Associate', 'provider': 'MongoDB', 'url': 'https://university.mongodb.com/certification/developer/about'},
-            {'name': 'MongoDB Certified DBA Associate', 'provider': 'MongoDB', 'url': 'https://university.mongodb.com/certification/dba/about'}
-        ],
-        
-        # Cloud Platforms
-        'AWS': [
-            {'name': 'AWS Certified Cloud Practitioner', 'provider': 'Amazon', 'url': 'https://aws.amazon.com/certification/certified-cloud-practitioner/'},
-            {'name': 'AWS Certified Solutions Architect - Associate', 'provider': 'Amazon', 'url': 'https://aws.amazon.com/certification/certified-solutions-architect-associate/'},
-            {'name': 'AWS Certified Developer - Associate', 'provider': 'Amazon', 'url': 'https://aws.amazon.com/certification/certified-developer-associate/'}
-        ],
-        'Azure': [
-            {'name': 'Microsoft Certified: Azure Fundamentals', 'provider': 'Microsoft', 'url': 'https://learn.microsoft.com/en-us/certifications/azure-fundamentals/'},
-            {'name': 'Microsoft Certified: Azure Administrator Associate', 'provider': 'Microsoft', 'url': 'https://learn.microsoft.com/en-us/certifications/azure-administrator/'}
-        ],
-        'Google Cloud': [
-            {'name': 'Google Cloud Digital Leader', 'provider': 'Google', 'url': 'https://cloud.google.com/certification/cloud-digital-leader'},
-            {'name': 'Google Cloud Associate Engineer', 'provider': 'Google', 'url': 'https://cloud.google.com/certification/cloud-engineer'}
-        ],
-        
-        # Tools & Platforms
-        'Docker': [
-            {'name': 'Docker Certified Associate', 'provider': 'Docker', 'url': 'https://training.mirantis.com/certification/dca-certification-exam/'},
-            {'name': 'Docker and Kubernetes: The Complete Guide', 'provider': 'Udemy', 'url': 'https://www.udemy.com/course/docker-and-kubernetes-the-complete-guide/'}
-        ],
-        'Kubernetes': [
-            {'name': 'Certified Kubernetes Administrator (CKA)', 'provider': 'CNCF', 'url': 'https://www.cncf.io/certification/cka/'},
-            {'name': 'Certified Kubernetes Application Developer (CKAD)', 'provider': 'CNCF', 'url': 'https://www.cncf.io/certification/ckad/'}
-        ],
-        
-        # Data Science & AI
-        'Machine Learning': [
-            {'name': 'Machine Learning Specialization', 'provider': 'Coursera', 'url': 'https://www.coursera.org/specializations/machine-learning-introduction'},
-            {'name': 'Professional Certificate in Machine Learning and Artificial Intelligence', 'provider': 'edX', 'url': 'https://www.edx.org/professional-certificate/ibm-machine-learning'}
-        ],
-        'Data Science': [
-            {'name': 'IBM Data Science Professional Certificate', 'provider': 'Coursera', 'url': 'https://www.coursera.org/professional-certificates/ibm-data-science'},
-            {'name': 'Microsoft Certified: Azure Data Scientist Associate', 'provider': 'Microsoft', 'url': 'https://learn.microsoft.com/en-us/certifications/azure-data-scientist/'}
-        ],
-        'TensorFlow': [
-            {'name': 'TensorFlow Developer Certificate', 'provider': 'TensorFlow', 'url': 'https://www.tensorflow.org/certificate'},
-            {'name': 'DeepLearning.AI TensorFlow Developer Professional Certificate', 'provider': 'Coursera', 'url': 'https://www.coursera.org/professional-certificates/tensorflow-in-practice'}
-        ],
-        
-        # General
-        'Project Management': [
-            {'name': 'Project Management Professional (PMP)', 'provider': 'PMI', 'url': 'https://www.pmi.org/certifications/project-management-pmp'},
-            {'name': 'Certified Associate in Project Management (CAPM)', 'provider': 'PMI', 'url': 'https://www.pmi.org/certifications/certified-associate-capm'}
-        ],
-        'Agile': [
-            {'name': 'Professional Scrum Master I (PSM I)', 'provider': 'Scrum.org', 'url': 'https://www.scrum.org/professional-scrum-certifications/professional-scrum-master-i-assessment'},
-            {'name': 'PMI Agile Certified Practitioner (PMI-ACP)', 'provider': 'PMI', 'url': 'https://www.pmi.org/certifications/agile-acp'}
-        ],
-        'Cybersecurity': [
-            {'name': 'CompTIA Security+', 'provider': 'CompTIA', 'url': 'https://www.comptia.org/certifications/security'},
-            {'name': 'Certified Information Systems Security Professional (CISSP)', 'provider': 'ISC2', 'url': 'https://www.isc2.org/Certifications/CISSP'}
-        ]
-    }
     
-    def __init__(self):
-        """Initialize the SkillsAnalyzer."""
-        self.stop_words = set(stopwords.words('english'))
-        # Flatten the skills list for easier matching
-        self.all_skills = []
-        for category, skills in self.TECH_SKILLS.items():
-            self.all_skills.extend(skills)
+    # Derived matching structures, built once at class definition and
+    # shared by every instance; rebuilding them per construction meant
+    # recompiling the union regex for each analyzer a server creates.
+    # Flattened skills list for easier matching
+    ALL_SKILLS = tuple(skill for skills in TECH_SKILLS.values() for skill in skills)
+    
+    # One union alternation finds every known skill in a single scan
+    # instead of one regex search per skill; longest-first ordering
+    # keeps overlapping names like 'Node.js' from losing to a prefix.
+    # Lookarounds instead of \b, because \b after a non-word character
+    # needs a following word character, so '\bc\+\+\b' would never match
+    # 'C++' before a space or at end of text
+    _skill_lookup = {skill.lower(): skill for skill in ALL_SKILLS}
+    _skills_re = re.compile(
+        r'(?<!\w)('
+        + '|'.join(re.escape(skill.lower())
+                   for skill in sorted(ALL_SKILLS, key=len, reverse=True))
+        + r')(?!\w)')
+    
+    # Skills whose names nest inside longer skill names, credited on a
+    # union-regex match so the fallback matches the automaton's output
+    _nested_skills = _contained_sub_skills(_skill_lookup)
+
+    # Aho-Corasick automaton over the same vocabulary, used instead
+    # of the union regex when the library is available
+    _skill_automaton = _build_skill_automaton(_skill_lookup)
     
     def extract_skills_from_job_description(self, job_description):
         """Extract required skills from a job description.
@@ -179,33 +137,9 @@ class SkillsAnalyzer:
         Returns:
             list: List of identified skills
         """
-        # Preprocess the job description
-        job_description = job_description.lower()
-        
-        # Extract skills using pattern matching
-        extracted_skills = set()
-        
-        # Check for each skill in our database
-        for skill in self.all_skills:
-            # Create a pattern that matches the skill as a whole word
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, job_description, re.IGNORECASE):
-                extracted_skills.add(skill)
-        
-        # Use NLP to extract additional potential skills
-        doc = nlp(job_description)
-        
-        # Look for noun phrases that might be skills
-        for chunk in doc.noun_chunks:
-            chunk_text = chunk.text.strip()
-            # Filter out very short or very long phrases
-            if 3 <= len(chunk_text) <= 30:
-                # Check if this chunk might be a skill (e.g., contains technical terms)
-                for skill in self.all_skills:
-                    if skill.lower() in chunk_text.lower():
-                        extracted_skills.add(skill)
-        
-        return list(extracted_skills)
+        # Extraction is pure, so it is memoized on the lowered text;
+        # re-analyzing the same posting is a cache hit
+        return list(_extract_skills_cached(job_description.lower()))
     
     def identify_missing_skills(self, resume_skills, job_skills):
         """Identify skills that are in the job description but not in the resume.
@@ -217,16 +151,12 @@ class SkillsAnalyzer:
         Returns:
             list: List of missing skills
         """
-        # Normalize skills for comparison
-        resume_skills_normalized = [skill.lower() for skill in resume_skills]
+        # Normalize once into a set; each job skill is then an O(1)
+        # hashed lookup instead of a scan of the resume list
+        resume_skills_normalized = frozenset(skill.lower() for skill in resume_skills)
         
-        # Find missing skills
-        missing_skills = []
-        for skill in job_skills:
-            if skill.lower() not in resume_skills_normalized:
-                missing_skills.append(skill)
-        
-        return missing_skills
+        return [skill for skill in job_skills
+                if skill.lower() not in resume_skills_normalized]
     
     def suggest_certifications(self, missing_skills):
         """Suggest certifications based on missing skills.
@@ -241,8 +171,9 @@ class SkillsAnalyzer:
         
         for skill in missing_skills:
             # Check if we have certification recommendations for this skill
-            if skill in self.CERTIFICATION_RECOMMENDATIONS:
-                certification_suggestions[skill] = self.CERTIFICATION_RECOMMENDATIONS[skill]
+            certifications = _certification_index().get(skill.lower())
+            if certifications:
+                certification_suggestions[skill] = certifications
         
         return certification_suggestions
     
@@ -259,14 +190,56 @@ class SkillsAnalyzer:
         # Extract skills from job description
         job_skills = self.extract_skills_from_job_description(job_description)
         
-        # Identify missing skills
-        missing_skills = self.identify_missing_skills(resume_skills, job_skills)
-        
-        # Suggest certifications for missing skills
-        certification_suggestions = self.suggest_certifications(missing_skills)
+        # One pass over the matches classifies each skill and collects
+        # its certifications, instead of a separate pass per result field
+        resume_set = frozenset(skill.lower() for skill in resume_skills)
+        cert_index = _certification_index()
+        missing_skills = []
+        certification_suggestions = {}
+        for skill in job_skills:
+            lowered = skill.lower()
+            if lowered not in resume_set:
+                missing_skills.append(skill)
+                certifications = cert_index.get(lowered)
+                if certifications:
+                    certification_suggestions[skill] = certifications
         
         return {
             'job_skills': job_skills,
             'missing_skills': missing_skills,
             'certification_suggestions': certification_suggestions
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=512)
+def _extract_skills_cached(jd_lower):
+    """Scan a lowered job description for every known skill.
+
+    One pass of the automaton when available, the precompiled union
+    pattern otherwise. Module-level so the lru_cache is shared across
+    analyzer instances.
+    """
+    automaton = SkillsAnalyzer._skill_automaton
+    if automaton is not None:
+        extracted_skills = set()
+        for end, (length, skill) in automaton.iter(jd_lower):
+            start = end - length + 1
+            # The automaton has no lookarounds, so apply the union
+            # regex's (?<!\w)/(?!\w) rule: reject matches with a word
+            # character on either side ('java' inside 'javascript')
+            if start > 0 and (jd_lower[start - 1].isalnum()
+                              or jd_lower[start - 1] == '_'):
+                continue
+            if end + 1 < len(jd_lower) and (jd_lower[end + 1].isalnum()
+                                            or jd_lower[end + 1] == '_'):
+                continue
+            extracted_skills.add(skill)
+        return frozenset(extracted_skills)
+    extracted_skills = set()
+    for match in SkillsAnalyzer._skills_re.findall(jd_lower):
+        extracted_skills.add(SkillsAnalyzer._skill_lookup[match])
+        # The regex is leftmost-longest, so skills nested in this match
+        # ('Ruby' in 'ruby on rails') never match on their own; credit
+        # them here the way the automaton path reports them
+        extracted_skills.update(SkillsAnalyzer._nested_skills.get(match, ()))
+    return frozenset(extracted_skills)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""Application factory shared by the Flask entrypoints.
+
+converter_app.py and integrated_app.py used to duplicate the conversion,
+download, and cleanup code and each imported every heavy dependency.
+create_app() registers only the blueprints a variant needs, so the
+converter-only app never imports the scraping stack and cold boot stays
+lean — which also keeps gunicorn's preload_app copy-on-write pages small.
+"""
+
+import os
+
+from flask import Flask, render_template, send_file
+from flask_compress import Compress
+
+
+def create_app(import_name, enable_scrape=False):
+    """Build a configured Flask app.
+
+    import_name should be the caller's __name__ so template/static paths
+    resolve relative to the entrypoint, not this package. With
+    enable_scrape the scraping blueprint (requests + HTML parsers) and
+    the template-driven SPA pages are added; without it the app serves
+    the pre-rendered converter landing page only.
+    """
+    app = Flask(import_name)
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+
+    # Gzip text responses; the index page shrinks roughly 4x on the wire
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json', 'text/css']
+    app.config['COMPRESS_LEVEL'] = 6
+    Compress(app)
+
+    # Let a fronting web server move download bytes with kernel sendfile()
+    app.use_x_sendfile = os.environ.get('USE_X_SENDFILE') == '1'
+
+    from .conversion import convert_bp, download_bp, start_cleanup_scheduler
+    app.register_blueprint(convert_bp)
+    app.register_blueprint(download_bp)
+
+    if enable_scrape:
+        # Deferred import: only this variant pays for the scraping stack
+        from .scraping import scrape_bp
+        app.register_blueprint(scrape_bp)
+
+        @app.route('/')
+        def index():
+            """Serve the main HTML interface."""
+            return render_template('index.html')
+
+        @app.route('/test')
+        def test():
+            """Serve a test HTML page."""
+            return send_file('test.html')
+
+        @app.route('/standalone')
+        def standalone():
+            """Serve a standalone test HTML page."""
+            return send_file('standalone_test.html')
+    else:
+        from .converter_page import page_bp
+        app.register_blueprint(page_bp)
+
+    # Clean up every 10 minutes instead of only once at startup. Under the
+    # debug reloader only the monitor process starts the scheduler, and under
+    # a preloading gunicorn the master runs it once for all workers.
+    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        start_cleanup_scheduler()
+
+    return app
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+"""Markdown-to-PDF conversion blueprints shared by every Flask entrypoint.
+
+Holds the background conversion pool, the content-hash PDF cache, the
+download route, and the periodic cleanup job.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from flask import Blueprint, request, send_from_directory, Response
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+
+from md_to_pdf import convert_markdown_bytes_to_pdf, prewarm
+from .util import j
+
+# Warm the render engine once at import so the first conversion doesn't pay
+# font registration and stylesheet setup
+prewarm()
+
+# Let a fronting web server move download bytes with kernel sendfile():
+# point X_ACCEL_REDIRECT_PREFIX at an internal nginx location aliasing
+# downloads/ (USE_X_SENDFILE is handled app-wide in create_app)
+X_ACCEL_REDIRECT_PREFIX = os.environ.get('X_ACCEL_REDIRECT_PREFIX')
+
+# Create necessary directories, anchored to the package root rather
+# than the process CWD: send_from_directory resolves relative paths
+# against app.root_path while the conversion jobs write relative to the
+# CWD, and the two disagree when the server starts elsewhere
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
+UPLOADS_DIR = _BASE_DIR / 'uploads'
+DOWNLOADS_DIR = _BASE_DIR / 'downloads'
+PUBLIC_DIR = _BASE_DIR / 'public'
+JOBS_DIR = _BASE_DIR / 'jobs'
+
+for directory in [UPLOADS_DIR, DOWNLOADS_DIR, PUBLIC_DIR, JOBS_DIR]:
+    directory.mkdir(exist_ok=True)
+
+# Stringified once so hot paths join plain strings instead of Path objects
+DOWNLOADS_STR = str(DOWNLOADS_DIR)
+
+# Background worker pool so PDF rendering never blocks a request handler
+executor = ThreadPoolExecutor(max_workers=2)
+
+# Job state lives on disk next to the output PDFs so a /status poll works
+# from any gunicorn worker, not just the one that accepted the job, and
+# the periodic cleanup prunes finished entries along with old files
+_JOB_ID_RE = re.compile(r'[0-9a-f]{32}')
+
+convert_bp = Blueprint('conversion', __name__)
+download_bp = Blueprint('download', __name__)
+
+
+def _job_path(job_id):
+    return os.path.join(str(JOBS_DIR), f"{job_id}.json")
+
+
+def _write_job(job_id, state):
+    """Record job state atomically so pollers never read a partial write."""
+    path = _job_path(job_id)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _read_job(job_id):
+    """Return the recorded state for a job id, or None if unknown."""
+    try:
+        with open(_job_path(job_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def find_cached_pdf(content_hash):
+    """Return the filename of a previously converted PDF for this hash, if any."""
+    pdf_filename = f"{content_hash}.pdf"
+    if (DOWNLOADS_DIR / pdf_filename).exists():
+        return pdf_filename
+    return None
+
+
+def render_pdf_job(job_id, md_bytes, pdf_path, pdf_filename):
+    """Run a conversion in the background and record the outcome for polling."""
+    try:
+        convert_markdown_bytes_to_pdf(md_bytes, pdf_path)
+        # Drop any stale negative lookups now that the PDF exists
+        find_cached_pdf.cache_clear()
+        _write_job(job_id, {'state': 'SUCCESS', 'filename': pdf_filename})
+    except Exception as e:
+        _write_job(job_id, {'state': 'FAILURE', 'error': str(e)})
+
+
+def submit_conversion(md_bytes):
+    """Queue a conversion for the given bytes and return its job id.
+
+    Identical content reuses the already-rendered PDF, so a cache hit
+    produces a job that is SUCCESS before the client ever polls it.
+    """
+    content_hash = hashlib.sha256(md_bytes).hexdigest()[:16]
+    job_id = uuid.uuid4().hex
+
+    cached_filename = find_cached_pdf(content_hash)
+    if cached_filename:
+        _write_job(job_id, {'state': 'SUCCESS', 'filename': cached_filename})
+        return job_id
+
+    # Convert the in-memory bytes in the background, leaving the hashed
+    # PDF in place for future cache hits; no upload-file roundtrip
+    pdf_filename = f"{content_hash}.pdf"
+    pdf_path = os.path.join(DOWNLOADS_STR, pdf_filename)
+
+    _write_job(job_id, {'state': 'PENDING'})
+    executor.submit(render_pdf_job, job_id, md_bytes, pdf_path, pdf_filename)
+    return job_id
+
+
+@convert_bp.route('/convert', methods=['POST'])
+def convert_file():
+    """Handle file upload and conversion."""
+    try:
+        # Check if file was uploaded
+        if 'markdown' not in request.files:
+            return j({'error': 'No file uploaded'}, 400)
+
+        file = request.files['markdown']
+        if file.filename == '':
+            return j({'error': 'No file selected'}, 400)
+
+        # Validate file type
+        if not file.filename.lower().endswith(('.md', '.markdown')):
+            return j({'error': 'Invalid file type. Please upload a Markdown file.'}, 400)
+
+        job_id = submit_conversion(file.stream.read())
+        return j({'success': True, 'job_id': job_id})
+
+    except Exception as e:
+        return j({'error': str(e)}, 500)
+
+
+@convert_bp.route('/convert-resume', methods=['POST'])
+def convert_resume():
+    """Convert tailored resume to PDF."""
+    try:
+        # Get the markdown content from the request
+        data = request.json
+        if not data or 'markdown' not in data:
+            return j({'error': 'No markdown content provided'}, 400)
+
+        job_id = submit_conversion(data['markdown'].encode('utf-8'))
+        return j({'success': True, 'job_id': job_id})
+
+    except Exception as e:
+        return j({'error': str(e)}, 500)
+
+
+@convert_bp.route('/status/<job_id>')
+def conversion_status(job_id):
+    """Report the state of a background conversion job."""
+    # Job ids are uuid4 hex; rejecting anything else keeps arbitrary
+    # paths out of the jobs directory lookup
+    job = _read_job(job_id) if _JOB_ID_RE.fullmatch(job_id) else None
+    if job is None:
+        return j({'error': 'Unknown job id'}, 404)
+    return j(job)
+
+
+@download_bp.route('/download/<filename>')
+def download_file(filename):
+    """Serve converted PDF files for download."""
+    try:
+        # Reject path-traversal attempts before touching the filesystem
+        if safe_join(str(DOWNLOADS_DIR), filename) is None:
+            return j({'error': 'File not found'}, 404)
+
+        if X_ACCEL_REDIRECT_PREFIX:
+            # Hand the transfer to nginx; it sendfile()s straight from disk.
+            # mtime+size make a cheap validator so repeat downloads can 304.
+            try:
+                stat = (DOWNLOADS_DIR / filename).stat()
+            except FileNotFoundError:
+                return j({'error': 'File not found'}, 404)
+
+            etag = f"{int(stat.st_mtime)}-{stat.st_size}"
+            if request.if_none_match.contains(etag):
+                return Response(status=304)
+
+            response = Response(mimetype='application/pdf')
+            response.headers['X-Accel-Redirect'] = f"{X_ACCEL_REDIRECT_PREFIX}/{filename}"
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+            response.headers['Cache-Control'] = 'private, max-age=3600'
+            response.set_etag(etag)
+            response.last_modified = stat.st_mtime
+            return response
+
+        # send_from_directory safe-joins and opens the file exactly once,
+        # handles Range/ETag via conditional=True, and keeps passthrough so
+        # the WSGI server's file_wrapper can move bytes with os.sendfile
+        try:
+            return send_from_directory(
+                DOWNLOADS_DIR,
+                filename,
+                as_attachment=True,
+                mimetype='application/pdf',
+                conditional=True,
+                max_age=3600
+            )
+        except NotFound:
+            return j({'error': 'File not found'}, 404)
+    except Exception as e:
+        return j({'error': str(e)}, 500)
+
+
+# Periodic cleanup of old files
+def cleanup_old_files():
+    """Remove files older than 1 hour."""
+    current_time = time.time()
+    removed = 0
+    for directory in [UPLOADS_DIR, DOWNLOADS_DIR, JOBS_DIR]:
+        # scandir reuses the stat from the directory scan, avoiding a
+        # second syscall per file
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                file_age = current_time - entry.stat().st_mtime
+                if file_age > 3600:  # 1 hour
+                    try:
+                        os.unlink(entry.path)
+                        removed += 1
+                        print(f"Cleaned up old file: {entry.path}")
+                    except Exception as e:
+                        print(f"Error cleaning up {entry.path}: {e}")
+    if removed:
+        # Deleted PDFs may still be memoized as present; forget them
+        find_cached_pdf.cache_clear()
+
+
+_scheduler = None
+
+
+def start_cleanup_scheduler():
+    """Clean up every 10 minutes; idempotent so both entrypoints can call it."""
+    global _scheduler
+    if _scheduler is None:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        _scheduler = BackgroundScheduler()
+        _scheduler.add_job(cleanup_old_files, 'interval', minutes=10)
+        _scheduler.start()
+    return _scheduler
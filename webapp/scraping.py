@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+
+"""Job-description scraping blueprint.
+
+Only imported by entrypoints that enable scraping, so the converter-only
+app never pays for requests, requests-cache, or the HTML parsers.
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+from requests_cache import CachedSession
+from bs4 import BeautifulSoup
+from flask import Blueprint, request
+from werkzeug.utils import secure_filename
+
+from .conversion import DOWNLOADS_DIR, UPLOADS_DIR
+from .util import j
+
+# selectolax parses HTML far faster than html.parser; fall back if missing
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+# Cap how much of a page we ingest so pathological pages don't balloon memory
+MAX_PAGE_BYTES = 2_000_000
+
+# Cache scraped pages for an hour; job posts rarely change faster than that,
+# and a transient upstream failure still serves the last known body
+SESSION = CachedSession(
+    'job_scrape_cache',
+    backend='sqlite',
+    expire_after=3600,
+    allowable_methods=('GET',),
+    stale_if_error=3600,
+)
+
+# Keep connections alive across scrapes so repeat requests to the same host
+# skip the TCP+TLS handshake, and retry transient upstream errors
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate, br',
+})
+
+# Worker pool for fetching job pages concurrently
+scrape_executor = ThreadPoolExecutor(max_workers=8)
+
+# Minimum spacing between requests to the same host, so unrelated hosts
+# never queue behind each other
+HOST_REQUEST_INTERVAL = 1.0
+host_last_request = {}
+host_lock = Lock()
+
+scrape_bp = Blueprint('scraping', __name__)
+
+
+def throttle_host(url):
+    """Sleep just enough to keep at most one request per second per host."""
+    host = urlparse(url).netloc
+    while True:
+        with host_lock:
+            now = time.monotonic()
+            wait = HOST_REQUEST_INTERVAL - (now - host_last_request.get(host, 0.0))
+            if wait <= 0:
+                host_last_request[host] = now
+                return
+        time.sleep(wait)
+
+
+def extract_page_text(content):
+    """Extract visible text from an HTML page, preferring the C parser."""
+    if SelectolaxParser is not None:
+        try:
+            tree = SelectolaxParser(content)
+            for tag in tree.css('script, style, noscript, svg'):
+                tag.decompose()
+            if tree.body is not None:
+                return tree.body.text(separator='\n', strip=True)
+        except Exception:
+            pass
+
+    # Fall back to BeautifulSoup with the pure-Python parser
+    soup = BeautifulSoup(content, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.extract()
+    return soup.get_text(separator='\n', strip=True)
+
+
+def scrape_job_description(url):
+    """Scrape job description from a URL and return the text content."""
+    try:
+        # Rate-limit per host, but only when we actually hit the network
+        if not SESSION.cache.contains(url=url):
+            throttle_host(url)
+
+        # Make the request on the pooled session
+        response = SESSION.get(url, timeout=30, stream=True)
+        response.raise_for_status()  # Raise an exception for 4XX/5XX responses
+
+        # Read at most MAX_PAGE_BYTES of the (decompressed) body
+        content = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+
+        # Extract text from the page (removing script and style elements)
+        text = extract_page_text(content)
+
+        return {
+            'success': True,
+            'text': text,
+            'url': url
+        }
+    except requests.exceptions.RequestException as e:
+        return {
+            'success': False,
+            'error': f"Error downloading {url}: {e}"
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"Unexpected error processing {url}: {e}"
+        }
+
+
+def read_urls_from_file(file_path):
+    """Read URLs from a text file, one URL per line."""
+    try:
+        with open(file_path, 'r') as file:
+            # Strip whitespace and filter out empty lines
+            urls = [line.strip() for line in file if line.strip()]
+        return urls
+    except FileNotFoundError:
+        raise Exception(f"Error: File '{file_path}' not found.")
+    except Exception as e:
+        raise Exception(f"Error reading file: {e}")
+
+
+def batch_download_content(urls, output_dir="downloaded_jobs"):
+    """Download content from multiple URLs and return results."""
+    results = []
+    success_count = 0
+    failure_count = 0
+
+    # Create output directory if it doesn't exist
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Validate URL formats up front
+    normalized_urls = [url if url.startswith(('http://', 'https://')) else 'https://' + url
+                       for url in urls]
+
+    # Fetch all URLs concurrently; throttle_host keeps us polite per host
+    scraped = list(scrape_executor.map(scrape_job_description, normalized_urls))
+
+    for i, (url, result) in enumerate(zip(normalized_urls, scraped), 1):
+        print(f"Processing {i}/{len(urls)}: {url}")
+
+        if result['success']:
+            # Create a filename based on the URL
+            parsed_url = urlparse(url)
+            domain = parsed_url.netloc
+            path = parsed_url.path.replace('/', '_')
+            if not path:
+                path = '_index'
+            filename = f"{domain}{path}.txt"
+
+            # Save the content to a file
+            output_path = os.path.join(output_dir, filename)
+            try:
+                with open(output_path, 'w', encoding='utf-8') as file:
+                    file.write(f"Source URL: {url}\n\n")
+                    file.write(result['text'])
+
+                success_count += 1
+                results.append({
+                    'url': url,
+                    'success': True,
+                    'filename': filename,
+                    'text': result['text']
+                })
+            except Exception as e:
+                failure_count += 1
+                results.append({
+                    'url': url,
+                    'success': False,
+                    'error': f"Error saving file: {e}"
+                })
+        else:
+            failure_count += 1
+            results.append({
+                'url': url,
+                'success': False,
+                'error': result['error']
+            })
+
+    return {
+        'results': results,
+        'summary': {
+            'total': len(urls),
+            'success': success_count,
+            'failed': failure_count,
+            'output_dir': os.path.abspath(output_dir)
+        }
+    }
+
+
+@scrape_bp.route('/scrape-job', methods=['POST'])
+def scrape_job():
+    """Scrape job description from a URL."""
+    try:
+        data = request.json
+        if not data or 'url' not in data:
+            return j({'error': 'No URL provided'}, 400)
+
+        url = data['url'].strip()
+        if not url:
+            return j({'error': 'Empty URL provided'}, 400)
+
+        # Validate URL format
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+
+        result = scrape_job_description(url)
+
+        if result['success']:
+            return j({
+                'success': True,
+                'text': result['text'],
+                'url': result['url']
+            })
+        else:
+            return j({'error': result['error']}, 400)
+
+    except Exception as e:
+        return j({'error': str(e)}, 500)
+
+
+@scrape_bp.route('/scrape-multiple-jobs', methods=['POST'])
+def scrape_multiple_jobs():
+    """Scrape job descriptions from multiple URLs."""
+    try:
+        data = request.json
+        if not data:
+            return j({'error': 'No data provided'}, 400)
+
+        urls = []
+
+        # Handle different input formats
+        if 'urls' in data:
+            # Direct URL list
+            urls = data['urls']
+        elif 'url_text' in data:
+            # URLs as text (one per line)
+            url_text = data['url_text'].strip()
+            if url_text:
+                urls = [line.strip() for line in url_text.split('\n') if line.strip()]
+        else:
+            return j({'error': 'No URLs provided. Use "urls" array or "url_text" string.'}, 400)
+
+        if not urls:
+            return j({'error': 'No valid URLs found'}, 400)
+
+        # Process URLs in batch
+        output_dir = DOWNLOADS_DIR / 'scraped_jobs'
+        result = batch_download_content(urls, str(output_dir))
+
+        return j({
+            'success': True,
+            'results': result['results'],
+            'summary': result['summary'],
+            'message': f"Processed {result['summary']['total']} URLs. {result['summary']['success']} successful, {result['summary']['failed']} failed."
+        })
+
+    except Exception as e:
+        return j({'error': str(e)}, 500)
+
+
+@scrape_bp.route('/scrape-urls-file', methods=['POST'])
+def scrape_urls_file():
+    """Scrape job descriptions from URLs in an uploaded file."""
+    try:
+        # Check if file was uploaded
+        if 'urls_file' not in request.files:
+            return j({'error': 'No file uploaded'}, 400)
+
+        file = request.files['urls_file']
+        if file.filename == '':
+            return j({'error': 'No file selected'}, 400)
+
+        # Validate file type
+        if not file.filename.lower().endswith(('.txt', '.csv')):
+            return j({'error': 'Invalid file type. Please upload a .txt or .csv file.'}, 400)
+
+        # Secure the filename and save temporarily; a content hash
+        # disambiguates without the millisecond-collision race
+        data = file.stream.read()
+        filename = secure_filename(file.filename)
+        content_hash = hashlib.sha256(data).hexdigest()[:16]
+        safe_filename = f"{content_hash}-{filename}"
+        temp_path = UPLOADS_DIR / safe_filename
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+
+        try:
+            # Read URLs from the uploaded file
+            urls = read_urls_from_file(str(temp_path))
+
+            if not urls:
+                return j({'error': 'No valid URLs found in the file'}, 400)
+
+            # Process URLs in batch
+            output_dir = DOWNLOADS_DIR / 'scraped_jobs'
+            result = batch_download_content(urls, str(output_dir))
+
+            return j({
+                'success': True,
+                'results': result['results'],
+                'summary': result['summary'],
+                'message': f"Processed {result['summary']['total']} URLs from file. {result['summary']['success']} successful, {result['summary']['failed']} failed."
+            })
+
+        finally:
+            # Clean up uploaded file
+            if temp_path.exists():
+                temp_path.unlink()
+
+    except Exception as e:
+        return j({'error': str(e)}, 500)
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+
+"""Small helpers shared by the web blueprints."""
+
+import orjson
+from flask import Response
+
+
+def j(payload, status=200):
+    """Serialize small JSON payloads with orjson, skipping jsonify overhead."""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')